@@ -5,9 +5,12 @@ import os
 import re
 from datetime import datetime
 
+import runlog
 from strands import Agent, tool
 from strands.models.ollama import OllamaModel
 from strands_tools import http_request
+from tool_pool import run_cpu_bound
+from tool_registry import shared_tool, shared_tools
 
 AUTOMATION_DIR = os.path.join("runlogs", "automation")
 
@@ -39,13 +42,17 @@ def write_text_file(path: str, text: str, mode: str = "w") -> str:
 @tool
 def read_text_file(path: str, max_chars: int | None = 4000) -> str:
     """Read text from file, optionally truncating to max_chars."""
-    if not os.path.exists(path):
+    if not runlog.exists(path):
         return f"Error: file not found: {path}"
-    with open(path, encoding="utf-8") as f:
-        data = f.read()
-    if max_chars is not None and len(data) > max_chars:
-        return data[:max_chars] + "\n...[truncated]"
-    return data
+    # Streams across rotated (possibly compressed) segments of runlogs, oldest first.
+    parts: list[str] = []
+    size = 0
+    for chunk in runlog.iter_chunks(path):
+        parts.append(chunk)
+        size += len(chunk)
+        if max_chars is not None and size > max_chars:
+            return "".join(parts)[:max_chars] + "\n...[truncated]"
+    return "".join(parts)
 
 
 @tool
@@ -65,14 +72,11 @@ def append_log(name: str, entry: str) -> str:
     os.makedirs(AUTOMATION_DIR, exist_ok=True)
     ts = datetime.utcnow().isoformat() + "Z"
     path = os.path.join(AUTOMATION_DIR, f"{name}.log")
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(f"[{ts}] {entry}\n")
+    runlog.append_line(path, f"[{ts}] {entry}")
     return f"Appended log entry to {path}"
 
 
-@tool
-def extract_title(html: str) -> str:
-    """Extract the <title> from HTML. Returns '(no title)' if not found."""
+def _extract_title(html: str) -> str:
     m = re.search(r"<title>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
     if not m:
         return "(no title)"
@@ -80,8 +84,12 @@ def extract_title(html: str) -> str:
 
 
 @tool
-def save_json(path: str, data: str) -> str:
-    """Save JSON string to a file with pretty formatting."""
+async def extract_title(html: str) -> str:
+    """Extract the <title> from HTML. Returns '(no title)' if not found."""
+    return await run_cpu_bound(_extract_title, html)
+
+
+def _save_json(path: str, data: str) -> str:
     try:
         obj = json.loads(data)
     except json.JSONDecodeError as e:
@@ -92,6 +100,12 @@ def save_json(path: str, data: str) -> str:
     return f"Saved JSON to {path}"
 
 
+@tool
+async def save_json(path: str, data: str) -> str:
+    """Save JSON string to a file with pretty formatting."""
+    return await run_cpu_bound(_save_json, path, data)
+
+
 def build_model() -> OllamaModel:
     model_tag = os.getenv("OLLAMA_MODEL", "qwen3:4b")
     return OllamaModel(host="http://localhost:11434", model_id=model_tag)
@@ -101,7 +115,9 @@ def build_file_agent(model: OllamaModel) -> Agent:
     return Agent(
         model=model,
         system_prompt="You manage files reliably. Prefer absolute/explicit paths.",
-        tools=[ensure_dir, write_text_file, read_text_file, list_dir, append_log, save_json],
+        tools=shared_tools(
+            [ensure_dir, write_text_file, read_text_file, list_dir, append_log, save_json]
+        ),
     )
 
 
@@ -109,17 +125,17 @@ def build_web_agent(model: OllamaModel) -> Agent:
     return Agent(
         model=model,
         system_prompt="You fetch URLs and extract key info using tools.",
-        tools=[http_request, extract_title],
+        tools=shared_tools([http_request, extract_title]),
     )
 
 
 def build_delegate_tools(file_agent: Agent, web_agent: Agent):
-    @tool
+    @shared_tool
     def files_task(instruction: str) -> str:
         """Delegate file-related tasks (create dirs, read/write files, logs, JSON)."""
         return str(file_agent(instruction))
 
-    @tool
+    @shared_tool
     def web_task(instruction: str) -> str:
         """Delegate web-related tasks (HTTP requests, parse titles)."""
         return str(web_agent(instruction))
@@ -0,0 +1,134 @@
+"""Concurrent agent throughput with large tool inputs: inline vs pooled tools.
+
+Each simulated agent calls its tools directly through `agent.tool.<name>(...)`, which
+runs the same tool execution path as a model-issued tool call without needing Ollama.
+Inline tools already run in strands' worker threads, so "thread pool" should match "inline";
+only "process pool" escapes the GIL, and its timing includes starting the worker processes.
+
+Usage:
+    python examples/python/bench_tool_pool.py [--agents 8] [--calls 4] [--size 2000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from automation_agents import _extract_title, _save_json, extract_title, save_json
+from business_rules_agent import _evaluate_order, evaluate_order_rules
+from simple_tools_agent import _count_letters, letter_counter
+from strands import Agent, tool
+from strands.models.ollama import OllamaModel
+from tool_pool import configure_tool_pool, get_tool_pool
+
+
+# Baselines: the same tool bodies executed inline, as before the pool existed.
+@tool(name="letter_counter")
+def letter_counter_inline(text: str) -> str:
+    """Count letters in the given text."""
+    return f"Letters: {_count_letters(text)}"
+
+
+@tool(name="extract_title")
+def extract_title_inline(html: str) -> str:
+    """Extract the <title> from HTML."""
+    return _extract_title(html)
+
+
+@tool(name="save_json")
+def save_json_inline(path: str, data: str) -> str:
+    """Save JSON string to a file with pretty formatting."""
+    return _save_json(path, data)
+
+
+@tool(name="evaluate_order_rules")
+def evaluate_order_rules_inline(order_json: str) -> str:
+    """Evaluate business rules for an order."""
+    return _evaluate_order(order_json)
+
+
+INLINE_TOOLS = [
+    letter_counter_inline,
+    extract_title_inline,
+    save_json_inline,
+    evaluate_order_rules_inline,
+]
+POOLED_TOOLS = [letter_counter, extract_title, save_json, evaluate_order_rules]
+
+
+def _inputs(size: int) -> dict[str, str]:
+    text = ("Hello, Strands! 123 " * (size // 20 + 1))[:size]
+    html = (
+        "<html><head><title>Bench</title></head><body>"
+        + "<p>x</p>" * (size // 8)
+        + "</body></html>"
+    )
+    payload = json.dumps(
+        [{"id": i, "name": f"item-{i}", "tags": ["a", "b"]} for i in range(size // 40)]
+    )
+    order = json.dumps(
+        {
+            "customer_tier": "Gold",
+            "order_total": 1450.75,
+            "new_customer": False,
+            "item_category": "electronics",
+            "stock_level": 3,
+            "region": "US",
+        }
+    )
+    return {"text": text, "html": html, "payload": payload, "order": order}
+
+
+def _run_agent(agent: Agent, inputs: dict[str, str], calls: int, out_dir: str, idx: int) -> None:
+    for n in range(calls):
+        agent.tool.letter_counter(text=inputs["text"], record_direct_tool_call=False)
+        agent.tool.extract_title(html=inputs["html"], record_direct_tool_call=False)
+        path = os.path.join(out_dir, f"agent{idx}-{n}.json")
+        agent.tool.save_json(path=path, data=inputs["payload"], record_direct_tool_call=False)
+        agent.tool.evaluate_order_rules(order_json=inputs["order"], record_direct_tool_call=False)
+
+
+def _bench(label: str, tools: list, args: argparse.Namespace, inputs: dict[str, str]) -> None:
+    model = OllamaModel(host="http://localhost:11434", model_id="bench")
+    agents = [Agent(model=model, tools=tools, callback_handler=None) for _ in range(args.agents)]
+    with tempfile.TemporaryDirectory() as out_dir:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.agents) as executor:
+            futures = [
+                executor.submit(_run_agent, agent, inputs, args.calls, out_dir, i)
+                for i, agent in enumerate(agents)
+            ]
+            for f in futures:
+                f.result()
+        elapsed = time.perf_counter() - start
+    total = args.agents * args.calls * len(tools)
+    print(f"{label:<14} {elapsed:8.2f}s  {total / elapsed:8.1f} tool calls/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=4)
+    parser.add_argument("--size", type=int, default=2_000_000, help="approx input size in chars")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    inputs = _inputs(args.size)
+    print(
+        f"agents={args.agents} calls/agent={args.calls} input_size={args.size} cpus={os.cpu_count()}"
+    )
+
+    _bench("inline", INLINE_TOOLS, args, inputs)
+    configure_tool_pool(kind="thread", max_workers=args.workers, timeout=None)
+    _bench("thread pool", POOLED_TOOLS, args, inputs)
+    configure_tool_pool(kind="process", max_workers=args.workers, timeout=None)
+    _bench("process pool", POOLED_TOOLS, args, inputs)
+    get_tool_pool().shutdown()
+
+
+if __name__ == "__main__":
+    main()
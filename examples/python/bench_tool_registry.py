@@ -0,0 +1,113 @@
+"""Agent construction time with and without the shared tool-spec registry.
+
+"without" builds the same agents as the build_* factories from plain tool lists and
+per-call @tool closures; "with" calls the factories, which go through tool_registry.
+
+Usage:
+    python examples/python/bench_tool_registry.py [--rounds 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import automation_agents
+import business_rules_agent
+import dummy_agents
+from strands import Agent, tool
+from strands.models.ollama import OllamaModel
+from strands_tools import calculator, current_time, http_request
+
+
+def _plain_delegate_tools(first: Agent, second: Agent):
+    @tool
+    def ask_a1(query: str) -> str:
+        """Delegate general questions to agent a1."""
+        return str(first(query))
+
+    @tool
+    def ask_a2(query: str) -> str:
+        """Delegate math problems to agent a2."""
+        return str(second(query))
+
+    return ask_a1, ask_a2
+
+
+def _plain_automation_delegate_tools(file_agent: Agent, web_agent: Agent):
+    @tool
+    def files_task(instruction: str) -> str:
+        """Delegate file-related tasks (create dirs, read/write files, logs, JSON)."""
+        return str(file_agent(instruction))
+
+    @tool
+    def web_task(instruction: str) -> str:
+        """Delegate web-related tasks (HTTP requests, parse titles)."""
+        return str(web_agent(instruction))
+
+    return files_task, web_task
+
+
+def _without_registry(model: OllamaModel) -> None:
+    a = automation_agents
+    a1 = Agent(model=model, tools=[current_time, dummy_agents.echo_upper], callback_handler=None)
+    a2 = Agent(model=model, tools=[calculator], callback_handler=None)
+    _plain_delegate_tools(a1, a2)
+    file_agent = Agent(
+        model=model,
+        tools=[
+            a.ensure_dir,
+            a.write_text_file,
+            a.read_text_file,
+            a.list_dir,
+            a.append_log,
+            a.save_json,
+        ],
+        callback_handler=None,
+    )
+    web_agent = Agent(model=model, tools=[http_request, a.extract_title], callback_handler=None)
+    _plain_automation_delegate_tools(file_agent, web_agent)
+    Agent(
+        model=model,
+        tools=[business_rules_agent.evaluate_order_rules, business_rules_agent.log_decision],
+        callback_handler=None,
+    )
+
+
+def _with_registry(model: OllamaModel) -> None:
+    a1 = dummy_agents.build_a1(model)
+    a2 = dummy_agents.build_a2(model)
+    dummy_agents.build_delegate_tools(a1, a2)
+    file_agent = automation_agents.build_file_agent(model)
+    web_agent = automation_agents.build_web_agent(model)
+    automation_agents.build_delegate_tools(file_agent, web_agent)
+    business_rules_agent.build_business_rules_agent(model)
+
+
+def _bench(
+    label: str, build: Callable[[OllamaModel], None], model: OllamaModel, rounds: int
+) -> None:
+    build(model)  # warm-up: fills the registry caches on the "with" side
+    start = time.perf_counter()
+    for _ in range(rounds):
+        build(model)
+    elapsed = time.perf_counter() - start
+    # Each round builds 5 agents and 4 delegate tools.
+    print(
+        f"{label:<18} {elapsed / rounds * 1000:8.3f} ms/round  {rounds * 5 / elapsed:9.1f} agents/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    model = OllamaModel(host="http://localhost:11434", model_id="bench")
+    _bench("without registry", _without_registry, model, args.rounds)
+    _bench("with registry", _with_registry, model, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,11 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any
 
+import runlog
 from strands import Agent, tool
 from strands.models.ollama import OllamaModel
+from tool_pool import run_cpu_bound
+from tool_registry import shared_tools
 
 RUN_DIR = os.path.join("runlogs", "business_rules")
 
@@ -30,21 +33,7 @@ def _safe_get(obj: dict[str, Any], key: str, default: Any = None) -> Any:
     return value
 
 
-@tool
-def evaluate_order_rules(order_json: str) -> str:
-    """Evaluate business rules for an order.
-
-    The input must be a JSON object with keys:
-    - customer_tier: one of "Gold" | "Silver" | "Bronze"
-    - order_total: number (USD)
-    - new_customer: boolean
-    - item_category: e.g., "electronics", "apparel", "groceries"
-    - stock_level: integer (units available)
-    - region: e.g., "US", "EU"
-
-    Returns a JSON string with fields: discount_percent, free_shipping,
-    require_manual_review, notes, rationale.
-    """
+def _evaluate_order(order_json: str) -> str:
     try:
         order = json.loads(order_json)
     except json.JSONDecodeError as exc:
@@ -117,6 +106,24 @@ def evaluate_order_rules(order_json: str) -> str:
     return json.dumps(asdict(decision), ensure_ascii=False)
 
 
+@tool
+async def evaluate_order_rules(order_json: str) -> str:
+    """Evaluate business rules for an order.
+
+    The input must be a JSON object with keys:
+    - customer_tier: one of "Gold" | "Silver" | "Bronze"
+    - order_total: number (USD)
+    - new_customer: boolean
+    - item_category: e.g., "electronics", "apparel", "groceries"
+    - stock_level: integer (units available)
+    - region: e.g., "US", "EU"
+
+    Returns a JSON string with fields: discount_percent, free_shipping,
+    require_manual_review, notes, rationale.
+    """
+    return await run_cpu_bound(_evaluate_order, order_json)
+
+
 @tool
 def log_decision(name: str, decision_json: str) -> str:
     """Append a timestamped business decision record to runlogs/business_rules/{name}.log.
@@ -135,8 +142,7 @@ def log_decision(name: str, decision_json: str) -> str:
         normalized = json.dumps(parsed, ensure_ascii=False, separators=(",", ":"))
     except Exception:
         normalized = decision_json
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(f"[{ts}] {normalized}\n")
+    runlog.append_line(path, f"[{ts}] {normalized}")
     return f"Appended decision entry to {path}"
 
 
@@ -154,7 +160,7 @@ def build_business_rules_agent(model: OllamaModel) -> Agent:
             "- After deciding, summarize succinctly and record using log_decision.\n"
             "- Keep outputs concise and structured."
         ),
-        tools=[evaluate_order_rules, log_decision],
+        tools=shared_tools([evaluate_order_rules, log_decision]),
     )
 
 
@@ -5,6 +5,7 @@ import os
 from strands import Agent, tool
 from strands.models.ollama import OllamaModel
 from strands_tools import calculator, current_time
+from tool_registry import shared_tool, shared_tools
 
 
 # Custom toy tool
@@ -24,7 +25,7 @@ def build_a1(model: OllamaModel) -> Agent:
     return Agent(
         model=model,
         system_prompt="You are a helpful general assistant. Be concise.",
-        tools=[current_time, echo_upper],
+        tools=shared_tools([current_time, echo_upper]),
     )
 
 
@@ -33,18 +34,18 @@ def build_a2(model: OllamaModel) -> Agent:
     return Agent(
         model=model,
         system_prompt="You are a math expert. Show brief steps.",
-        tools=[calculator],
+        tools=shared_tools([calculator]),
     )
 
 
 # Tool wrappers to delegate to a1 and a2 (for a3 orchestrator)
 def build_delegate_tools(a1: Agent, a2: Agent):
-    @tool
+    @shared_tool
     def ask_a1(query: str) -> str:
         """Delegate general questions to agent a1."""
         return str(a1(query))
 
-    @tool
+    @shared_tool
     def ask_a2(query: str) -> str:
         """Delegate math problems to agent a2."""
         return str(a2(query))
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import gzip
+import io
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import IO
+
+try:
+    import zstandard
+except ImportError:  # optional: only needed for compression="zstd"
+    zstandard = None
+
+SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_STAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+_SEGMENT_RE = re.compile(r"^\d{8}T\d{12}Z(\.gz|\.zst)?$")
+_TS_RE = re.compile(r"^\[(\d{4}-\d{2}-\d{2}T[^\]]+?)Z?\]")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RunlogPolicy:
+    """When to rotate an append-only log and how long to keep rotated segments.
+
+    The active file `name.log` is rotated to `name.log.<UTC timestamp>` once it reaches
+    `max_bytes` or its first entry is older than `max_age` seconds. Rotated segments are
+    compressed in the background and pruned beyond `max_segments` or `retention` seconds.
+    A value of 0 (or None for compression) disables that limit.
+    """
+
+    max_bytes: int = 10 * 1024 * 1024
+    max_age: float = 24 * 3600
+    max_segments: int = 10
+    retention: float = 30 * 24 * 3600
+    compression: str | None = "gzip"
+
+    def __post_init__(self) -> None:
+        if self.compression is not None and self.compression not in SUFFIXES:
+            raise ValueError(f"compression must be one of {sorted(SUFFIXES)} or None")
+        if self.compression == "zstd" and zstandard is None:
+            raise ValueError("compression='zstd' requires the 'zstandard' package")
+
+    @classmethod
+    def from_env(cls) -> RunlogPolicy:
+        compression = os.getenv("RUNLOG_COMPRESSION", "gzip")
+        return cls(
+            max_bytes=int(os.getenv("RUNLOG_MAX_BYTES", cls.max_bytes)),
+            max_age=float(os.getenv("RUNLOG_MAX_AGE", cls.max_age)),
+            max_segments=int(os.getenv("RUNLOG_MAX_SEGMENTS", cls.max_segments)),
+            retention=float(os.getenv("RUNLOG_RETENTION", cls.retention)),
+            compression=None if compression in {"", "none"} else compression,
+        )
+
+
+_default_policy: RunlogPolicy | None = None
+_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+_started: dict[str, datetime | None] = {}
+_maintained: set[str] = set()
+_jobs: queue.Queue[tuple[str, RunlogPolicy]] = queue.Queue()
+_worker: threading.Thread | None = None
+
+
+def default_policy() -> RunlogPolicy:
+    global _default_policy
+    if _default_policy is None:
+        _default_policy = RunlogPolicy.from_env()
+    return _default_policy
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def _first_entry_time(path: str) -> datetime | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            m = _TS_RE.match(f.readline())
+    except OSError:
+        return None
+    if not m:
+        return None
+    try:
+        return datetime.fromisoformat(m.group(1))
+    except ValueError:
+        return None
+
+
+def segments(path: str) -> list[str]:
+    """Return rotated segments of path, oldest first (compressed or not)."""
+    directory = os.path.dirname(path) or "."
+    prefix = os.path.basename(path) + "."
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    found = sorted(n for n in names if n.startswith(prefix) and _SEGMENT_RE.match(n[len(prefix) :]))
+    return [os.path.join(directory, n) for n in found]
+
+
+def _segment_stem(segment: str) -> str:
+    for suffix in SUFFIXES.values():
+        if segment.endswith(suffix):
+            return segment[: -len(suffix)]
+    return segment
+
+
+def _rotate(path: str, policy: RunlogPolicy) -> None:
+    while True:
+        target = f"{path}.{datetime.utcnow().strftime(_STAMP_FORMAT)}"
+        if not any(os.path.exists(target + s) for s in ("", *SUFFIXES.values())):
+            break
+    try:
+        os.replace(path, target)
+    except PermissionError:
+        # Windows refuses to rename a file another handle (e.g. a reader) has open.
+        # Keep appending to the active file; the next append tries again.
+        logger.debug("path=<%s> | log is open elsewhere, postponing rotation", path)
+        return
+    _started[path] = None
+    _submit(path, policy)
+
+
+def _needs_rotation(path: str, policy: RunlogPolicy, now: datetime) -> bool:
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        size = 0
+    if size == 0:
+        # Missing or cleared from outside: the next entry starts a new segment.
+        _started.pop(path, None)
+        return False
+    if policy.max_bytes and size >= policy.max_bytes:
+        return True
+    if policy.max_age:
+        if path not in _started:
+            _started[path] = _first_entry_time(path)
+        started = _started[path]
+        if started is not None and (now - started).total_seconds() >= policy.max_age:
+            return True
+    return False
+
+
+def append_line(path: str, line: str, policy: RunlogPolicy | None = None) -> None:
+    """Append one line to a runlog, rotating it first if the policy says so.
+
+    Safe to call from several threads; writes to the same path are serialized in-process.
+    """
+    policy = policy or default_policy()
+    now = datetime.utcnow()
+    with _lock_for(path):
+        if path not in _maintained:
+            # Apply compression and retention to segments left by earlier runs.
+            _maintained.add(path)
+            _submit(path, policy)
+        if _needs_rotation(path, policy, now):
+            _rotate(path, policy)
+        if _started.get(path) is None:
+            _started[path] = now
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def _compress(segment: str, compression: str) -> None:
+    target = segment + SUFFIXES[compression]
+    tmp = target + ".tmp"
+    with open(segment, "rb") as src, open(tmp, "wb") as raw:
+        if compression == "gzip":
+            with gzip.GzipFile(fileobj=raw, mode="wb") as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            with zstandard.ZstdCompressor().stream_writer(raw) as dst:
+                shutil.copyfileobj(src, dst)
+    # Publish the compressed copy before removing the original so readers always find one.
+    os.replace(tmp, target)
+    _remove_original(segment)
+
+
+def _remove_original(segment: str) -> None:
+    try:
+        os.remove(segment)
+    except PermissionError:
+        # Open in a reader on Windows; readers prefer it, the next maintenance pass removes it.
+        logger.debug("segment=<%s> | segment is open elsewhere, keeping original", segment)
+
+
+def _prune(path: str, policy: RunlogPolicy) -> None:
+    # A segment whose raw original outlived its compressed copy still counts once.
+    by_stem: dict[str, list[str]] = {}
+    for segment in segments(path):
+        by_stem.setdefault(_segment_stem(segment), []).append(segment)
+    stems = sorted(by_stem)
+    expired: set[str] = set()
+    if policy.max_segments and len(stems) > policy.max_segments:
+        expired.update(stems[: len(stems) - policy.max_segments])
+    if policy.retention:
+        # Age comes from the rotation time in the name; compression resets file mtimes.
+        now = datetime.utcnow()
+        for stem in stems:
+            rotated = datetime.strptime(stem.rsplit(".", 1)[1], _STAMP_FORMAT)
+            if (now - rotated).total_seconds() > policy.retention:
+                expired.add(stem)
+    for stem in expired:
+        for segment in by_stem[stem]:
+            try:
+                os.remove(segment)
+            except (FileNotFoundError, PermissionError):
+                pass
+
+
+def _maintain(path: str, policy: RunlogPolicy) -> None:
+    if policy.compression:
+        existing = set(segments(path))
+        for segment in sorted(existing):
+            if _segment_stem(segment) != segment:
+                continue
+            if any(segment + suffix in existing for suffix in SUFFIXES.values()):
+                _remove_original(segment)  # compressed earlier, removal was postponed
+            else:
+                _compress(segment, policy.compression)
+    _prune(path, policy)
+
+
+def _run_worker() -> None:
+    while True:
+        path, policy = _jobs.get()
+        try:
+            _maintain(path, policy)
+        except Exception:
+            logger.exception("path=<%s> | runlog maintenance failed", path)
+        finally:
+            _jobs.task_done()
+
+
+def _submit(path: str, policy: RunlogPolicy) -> None:
+    global _worker
+    with _locks_guard:
+        if _worker is None:
+            _worker = threading.Thread(target=_run_worker, name="runlog-maintenance", daemon=True)
+            _worker.start()
+    _jobs.put((path, policy))
+
+
+def flush() -> None:
+    """Block until pending compression and pruning work has finished."""
+    _jobs.join()
+
+
+atexit.register(flush)
+
+
+def _open_segment(segment: str) -> IO[str] | None:
+    # A segment may be compressed between listing and opening it; fall back to the compressed copy.
+    stem = _segment_stem(segment)
+    for candidate in (stem, stem + SUFFIXES["gzip"], stem + SUFFIXES["zstd"]):
+        try:
+            if candidate.endswith(SUFFIXES["gzip"]):
+                return gzip.open(candidate, "rt", encoding="utf-8")
+            if candidate.endswith(SUFFIXES["zstd"]):
+                if zstandard is None:
+                    continue
+                with contextlib.ExitStack() as stack:
+                    # Closes the file if the decompressor cannot be set up.
+                    raw = stack.enter_context(open(candidate, "rb"))
+                    reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+                    stack.pop_all()
+                return io.TextIOWrapper(reader, encoding="utf-8")
+            return open(candidate, encoding="utf-8")
+        except FileNotFoundError:
+            continue
+    return None
+
+
+def exists(path: str) -> bool:
+    """True if path or any of its rotated segments exist."""
+    return os.path.exists(path) or bool(segments(path))
+
+
+def iter_chunks(path: str, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """Yield the text of all rotated segments, oldest first, then the active file.
+
+    The writer lock is held only while the active file is opened and the segments are
+    listed, which fixes a consistent snapshot; reading happens outside it. A rotation
+    while reading renames the file behind the open handle, so nothing is skipped or read
+    twice. On Windows the open handle instead makes writers postpone rotation.
+    """
+    with contextlib.ExitStack() as stack:
+        with _lock_for(path):
+            try:
+                active: IO[str] | None = stack.enter_context(open(path, encoding="utf-8"))
+            except FileNotFoundError:
+                active = None
+            listed = segments(path)
+        seen: set[str] = set()
+        for segment in listed:
+            stem = _segment_stem(segment)
+            if stem in seen:
+                continue
+            seen.add(stem)
+            f = _open_segment(segment)
+            if f is None:
+                continue  # pruned while we were reading
+            with f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+        if active is not None:
+            while chunk := active.read(chunk_size):
+                yield chunk
+
+
+def iter_lines(path: str) -> Iterator[str]:
+    """Yield lines (without newlines) across rotated segments and the active file."""
+    pending = ""
+    for chunk in iter_chunks(path):
+        pending += chunk
+        *lines, pending = pending.split("\n")
+        yield from lines
+    if pending:
+        yield pending
@@ -5,17 +5,23 @@ import os
 from strands import Agent, tool
 from strands.models.ollama import OllamaModel
 from strands_tools import calculator, current_time
+from tool_pool import run_cpu_bound
+
+
+def _count_letters(text: str) -> int:
+    letters = [c for c in text if c.isalpha()]
+    return len(letters)
 
 
 @tool
-def letter_counter(text: str) -> str:
+async def letter_counter(text: str) -> str:
     """Count letters in the given text.
 
     Args:
         text: The text to analyze
     """
-    letters = [c for c in text if c.isalpha()]
-    return f"Letters: {len(letters)}"
+    count = await run_cpu_bound(_count_letters, text)
+    return f"Letters: {count}"
 
 
 def main() -> None:
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+POOL_KINDS = {"process", "thread"}
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _noop() -> None:
+    pass
+
+
+class ToolPool:
+    """Bounded worker pool for the CPU-bound part of a tool.
+
+    strands already runs sync tools in a thread, so they do not block the event loop, but
+    they still share the GIL with every other agent in the process. With kind="process"
+    (default) the work runs in separate processes and scales across cores. kind="thread"
+    adds no parallelism; it only caps how many such jobs run at once.
+
+    At most `max_workers` jobs run at once and at most `max_pending` are in flight in total.
+    `timeout` bounds the time a job spends waiting for one of the `max_pending` slots plus
+    its run time. Time queued for a free worker is not counted: every job ahead of it is
+    already bounded the same way. Functions sent to a process pool must be defined at
+    module level so they can be pickled.
+    """
+
+    def __init__(
+        self,
+        kind: str = "process",
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        timeout: float | None = 30.0,
+    ) -> None:
+        if kind not in POOL_KINDS:
+            raise ValueError(f"kind must be one of {sorted(POOL_KINDS)}, got {kind!r}")
+        self.kind = kind
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max(max_pending or self.max_workers * 4, self.max_workers)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        # Jobs are only handed to the executor once a worker is free, so each one starts
+        # running straight away and its timeout measures run time, not queueing.
+        self._workers = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    # The pool is created lazily from a multi-threaded process; never fork it.
+                    executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context(_START_METHOD),
+                    )
+                    # Start every worker now so process start-up is not charged to the
+                    # timeout of the first jobs.
+                    try:
+                        for f in [executor.submit(_noop) for _ in range(self.max_workers)]:
+                            f.result()
+                    except BaseException:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                    self._executor = executor
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="tool-pool"
+                    )
+            return self._executor
+
+    def _discard(self, executor: Executor, terminate: bool = False) -> None:
+        """Stop handing out executor so the next call builds a fresh one.
+
+        With terminate=True its worker processes are killed, which frees workers stuck on a
+        timed-out job; other jobs still running on them fail with BrokenProcessPool and are
+        retried by their callers.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        if terminate:
+            # ProcessPoolExecutor has no public way to kill its workers before Python 3.14.
+            for process in list((getattr(executor, "_processes", None) or {}).values()):
+                process.terminate()
+        # Leave outstanding futures alone: they fail as broken rather than being cancelled.
+        executor.shutdown(wait=False)
+
+    def _submit(self, fn: Callable[..., T], *args: Any) -> tuple[Executor, Future[T], float | None]:
+        """Submit once a slot and a worker are free; return the run time left for the job."""
+        start = time.monotonic()
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"tool pool busy: no free slot within {self.timeout}s")
+        budget = (
+            None if self.timeout is None else max(0.0, self.timeout - (time.monotonic() - start))
+        )
+        try:
+            self._workers.acquire()
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(fn, *args)
+            except BrokenExecutor:
+                # A worker died (e.g. out of memory) since the last call; start over once.
+                self._discard(executor)
+                executor = self._get_executor()
+                future = executor.submit(fn, *args)
+        except BaseException:
+            self._workers.release()
+            self._slots.release()
+            raise
+
+        # Both are held until the worker is done, even if the caller stopped waiting.
+        def release(_: Future[T]) -> None:
+            self._workers.release()
+            self._slots.release()
+
+        future.add_done_callback(release)
+        return executor, future, budget
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> Future[T]:
+        """Submit fn(*args) to the pool, blocking until a slot and a worker are free.
+
+        Raises:
+            TimeoutError: If no slot frees up within the pool timeout.
+        """
+        return self._submit(fn, *args)[1]
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) in the pool and await its result.
+
+        If the pool breaks while the job runs (a worker died, or another caller's timeout
+        recycled the pool), it is replaced and the job is retried once. On timeout a process
+        pool is recycled so the stuck worker is killed; a thread pool cannot interrupt the
+        job, which keeps its worker until it returns.
+
+        Raises:
+            TimeoutError: If no slot frees up in time or the job runs past the pool timeout.
+            BrokenExecutor: If the retry breaks the pool again.
+        """
+        retried = False
+        while True:
+            executor, future, budget = await asyncio.to_thread(self._submit, fn, *args)
+            # asyncio.wait neither raises nor cancels on timeout, so the outcome can be read
+            # from the concurrent future; cancelling this task still propagates.
+            waiter = asyncio.wrap_future(future)
+            await asyncio.wait({waiter}, timeout=budget)
+            if not waiter.done():
+                waiter.cancel()  # stop tracking the abandoned job; a running job is unaffected
+                if self.kind == "process" and future.running():
+                    self._discard(executor, terminate=True)
+                raise TimeoutError(f"{fn.__name__} did not finish within {self.timeout}s")
+            try:
+                # This task was not cancelled (asyncio.wait would have raised), so a cancelled
+                # waiter means the job itself was cancelled by a pool shutdown.
+                if waiter.cancelled():
+                    raise BrokenExecutor(f"{fn.__name__} was cancelled by a pool shutdown")
+                return waiter.result()
+            except BrokenExecutor:
+                self._discard(executor)
+                if retried:
+                    raise
+                retried = True
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+
+_default_pool: ToolPool | None = None
+_default_lock = threading.Lock()
+
+
+def _pool_from_env() -> ToolPool:
+    workers = os.getenv("TOOL_POOL_WORKERS")
+    timeout = os.getenv("TOOL_POOL_TIMEOUT", "30")
+    return ToolPool(
+        kind=os.getenv("TOOL_POOL_KIND", "process"),
+        max_workers=int(workers) if workers else None,
+        timeout=float(timeout) if timeout else None,
+    )
+
+
+def get_tool_pool() -> ToolPool:
+    """Return the shared pool, creating it from TOOL_POOL_* env vars on first use."""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = _pool_from_env()
+        return _default_pool
+
+
+def configure_tool_pool(**kwargs: Any) -> ToolPool:
+    """Replace the shared pool with a new ToolPool(**kwargs), shutting down the old one."""
+    global _default_pool
+    with _default_lock:
+        old, _default_pool = _default_pool, ToolPool(**kwargs)
+    if old is not None:
+        old.shutdown()
+    return _default_pool
+
+
+async def run_cpu_bound(fn: Callable[..., T], *args: Any) -> T:
+    """Run a CPU-bound tool body in the shared pool and await its result."""
+    return await get_tool_pool().run(fn, *args)
+
+
+@atexit.register
+def _shutdown_default_pool() -> None:
+    if _default_pool is not None:
+        _default_pool.shutdown(wait=False)
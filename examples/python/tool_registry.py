@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import inspect
+import threading
+from collections.abc import Callable, Iterable
+from types import CellType, CodeType, FunctionType, ModuleType
+from typing import Any
+
+from strands.tools.decorator import DecoratedFunctionTool, FunctionToolMetadata
+from strands.tools.registry import ToolRegistry
+from strands.tools.tools import PythonAgentTool, normalize_tool_spec
+from strands.types.tools import AgentTool, ToolSpec
+
+
+def _without_closure(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Copy func with empty closure cells, for introspection only.
+
+    The cached metadata outlives the closure it was built from; keeping the original would
+    keep whatever it captured (e.g. a delegate Agent and its history) alive for good.
+    """
+    code = func.__code__
+    cells = tuple(CellType() for _ in code.co_freevars)
+    copy = FunctionType(code, func.__globals__, func.__name__, func.__defaults__, cells)
+    copy.__kwdefaults__ = func.__kwdefaults__
+    copy.__annotations__ = dict(func.__annotations__)
+    copy.__doc__ = func.__doc__
+    copy.__qualname__ = func.__qualname__
+    copy.__module__ = func.__module__
+    return copy
+
+
+class ToolSpecRegistry:
+    """Process-wide cache of resolved tools and their normalized specs.
+
+    Agent factories pass their tool lists through `resolve` so each tool is introspected
+    once per process and the resulting AgentTool objects are shared by every Agent built
+    afterwards. Specs are normalized and validated once, up front.
+
+    The specs are shared, mutable dicts, not frozen copies: strands hands them to models
+    and hooks as plain dicts and normalizes them in place. Anything that edits a spec it
+    got from an Agent changes it for every Agent using that tool.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._modules: dict[ModuleType, list[AgentTool]] = {}
+        self._closures: dict[CodeType, tuple[str, ToolSpec, FunctionToolMetadata]] = {}
+        self._validator = ToolRegistry()
+
+    def _prepare_spec(self, spec: ToolSpec) -> ToolSpec:
+        spec = normalize_tool_spec(spec)
+        self._validator.validate_tool_spec(spec)
+        return spec
+
+    def _load_module(self, module: ModuleType) -> list[AgentTool]:
+        # Mirrors ToolRegistry.process_tools, but uses the already-imported module instead
+        # of re-executing its file for every Agent.
+        tool_name = module.__name__.split(".")[-1]
+        if hasattr(module, "TOOL_SPEC") and hasattr(module, tool_name):
+            spec = self._prepare_spec(module.TOOL_SPEC)
+            return [PythonAgentTool(tool_name, spec, getattr(module, tool_name))]
+        return [
+            obj for _, obj in inspect.getmembers(module) if isinstance(obj, DecoratedFunctionTool)
+        ]
+
+    def resolve(self, tools: Iterable[Any]) -> list[Any]:
+        """Return tools with imported modules replaced by their cached AgentTools.
+
+        Decorated functions and other AgentTools already carry a spec computed once at
+        decoration time and are passed through, as are tool names and paths.
+        """
+        resolved: list[Any] = []
+        for t in tools:
+            if inspect.ismodule(t):
+                with self._lock:
+                    if t not in self._modules:
+                        self._modules[t] = self._load_module(t)
+                    resolved.extend(self._modules[t])
+            else:
+                resolved.append(t)
+        return resolved
+
+    def tool(self, func: Callable[..., Any]) -> DecoratedFunctionTool:
+        """Like @tool, but reuses the spec of earlier closures created from the same code.
+
+        Intended for tools defined inside factory functions, which are re-created on every
+        call but always have the same signature and docstring.
+        """
+        code = func.__code__
+        with self._lock:
+            entry = self._closures.get(code)
+            if entry is None:
+                metadata = FunctionToolMetadata(_without_closure(func))
+                spec = self._prepare_spec(metadata.extract_metadata())
+                entry = self._closures[code] = (spec["name"], spec, metadata)
+        name, spec, metadata = entry
+        return DecoratedFunctionTool(name, spec, func, metadata)
+
+
+_registry = ToolSpecRegistry()
+
+
+def shared_tools(tools: Iterable[Any]) -> list[Any]:
+    """Resolve a tool list through the process-wide ToolSpecRegistry."""
+    return _registry.resolve(tools)
+
+
+def shared_tool(func: Callable[..., Any]) -> DecoratedFunctionTool:
+    """Decorator for factory-local tools backed by the process-wide ToolSpecRegistry."""
+    return _registry.tool(func)